@@ -1,20 +1,158 @@
 import streamlit as st
 import pandas as pd
-from io import BytesIO
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Tuple
 
 from macro_data_api import (
     build_country_table,
-    fetch_imf_gdp_growth_weo,
-    fetch_imf_cpi_inflation_weo,
+    chunk_area_codes,
+    concat_dm_frames,
+    imf_dm_fetch_indicator,
     wb_fetch_indicator,
 )
+from macro_data_export import write_csv_zip, write_xlsx
+
+# Streamlit reruns the whole script on every widget event; cache the country
+# table and each pulled series so only new parameter combinations hit the APIs.
+CACHE_TTL = 6 * 3600
+
+
+SAMPLE_ISO3 = frozenset({"ARG", "BRA", "ZAF"})
+
+START_YEAR = 1990
+END_YEAR = 2025
+
+# (indicator code, sheet name), in workbook order.
+IMF_JOBS: Tuple[Tuple[str, str], ...] = (
+    ("NGDP_RPCH", "imf_weo_gdp_growth"),  # WEO real GDP growth
+    ("PCPIPCH", "imf_weo_cpi_inflation"),  # WEO CPI inflation, average (pct change)
+)
+WB_JOBS: Tuple[Tuple[str, str], ...] = (
+    ("NY.GDP.MKTP.KD.ZG", "wb_gdp_growth"),
+    ("BN.CAB.XOKA.GD.ZS", "wb_current_account"),  # % of GDP
+    ("BX.KLT.DINV.WD.GD.ZS", "wb_fdi"),  # FDI net inflows, % of GDP
+    ("FI.RES.TOTL.MO", "wb_reserves"),  # months of imports
+    ("GC.DOD.TOTL.GD.ZS", "wb_debt"),  # government debt, % of GDP
+)
+
+# Countries per IMF DataMapper request.
+IMF_CHUNK_SIZE = 10
+
+# Low-cardinality World Bank columns stored as categoricals (IMF frames
+# already come back categorical).
+WB_CATEGORY_COLUMNS = ("country", "iso3", "indicator")
+
+
+@st.cache_data(ttl=CACHE_TTL)
+def cached_countries(sample_only: bool) -> pd.DataFrame:
+    countries = build_country_table()
+    countries = countries.astype({"iso2": "category", "iso3": "category"})
+    countries = countries[countries["iso2"].notna() & countries["iso3"].notna()]
+    if sample_only:
+        mask = countries["iso3"].map(SAMPLE_ISO3.__contains__).to_numpy(dtype=bool)
+        countries = countries.iloc[mask]
+    # Keep the categories equal to the codes actually in the table.
+    return countries.assign(
+        iso2=countries["iso2"].cat.remove_unused_categories(),
+        iso3=countries["iso3"].cat.remove_unused_categories(),
+    )
+
+
+def _to_arrow(df: pd.DataFrame) -> pd.DataFrame:
+    # Arrow-backed columns keep strings out of Python objects and track
+    # missing values in a validity bitmap. `value` stays double even when a
+    # pull happens to contain only whole numbers. Categoricals are left as
+    # they are: concat_dm_frames unions their categories, and pandas 2 would
+    # turn an all-NA categorical (e.g. labels of unknown areas) into
+    # null[pyarrow].
+    converted = df.select_dtypes(exclude="category").convert_dtypes(dtype_backend="pyarrow")
+    df = df.assign(**{c: converted[c] for c in converted.columns})
+    return df.astype({"value": "double[pyarrow]"}) if "value" in df else df
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def cached_imf(indicator: str, iso3: Tuple[str, ...], start_year: int, end_year: int) -> pd.DataFrame:
+    return _to_arrow(imf_dm_fetch_indicator(
+        indicator=indicator,
+        ref_areas=iso3,
+        start_year=start_year,
+        end_year=end_year,
+    ))
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def cached_wb(indicator: str, iso3: Tuple[str, ...], start_year: int, end_year: int) -> pd.DataFrame:
+    return _to_arrow(wb_fetch_indicator(
+        indicator=indicator,
+        iso3_list=iso3,
+        start_year=start_year,
+        end_year=end_year,
+    ))
+
+
+# Above this many rows in any sheet, xlsx serialization gets very slow.
+XLSX_ROW_WARNING = 100_000
+
+EXPORT_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+
+OUTPUT_FORMATS = {
+    "xlsx": (
+        write_xlsx,
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ),
+    "csv.zip": (write_csv_zip, "application/zip"),
+}
+
+
+def _content_hash(df: pd.DataFrame) -> str:
+    # hash_pandas_object runs in C; blake2b over its output is a cheap digest.
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(list(df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+@st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+def build_export(key: tuple, output_format: str, _sheets: Dict[str, pd.DataFrame]) -> bytes:
+    # Only `key` and `output_format` are hashed (Streamlit skips
+    # underscore-prefixed arguments): `key` holds a content hash per sheet, so
+    # the file is rebuilt only when some sheet's data actually changed.
+    writer, _ = OUTPUT_FORMATS[output_format]
+    # Stays in memory for typical pulls, spills to disk for very large ones.
+    with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES, mode="w+b") as output:
+        writer(output, _sheets)
+        output.seek(0)
+        return output.read()
+
+
+class _ThrottledProgress:
+    """
+    Progress bar + status line that only re-render once the bar has moved by
+    at least `min_delta` points (or reached 100), so a pull made of hundreds
+    of small requests doesn't send a frontend update per request.
+    """
+
+    def __init__(self, bar, status, start: int = 0, min_delta: int = 5):
+        self.bar = bar
+        self.status = status
+        self.min_delta = min_delta
+        self.last = start
+
+    def update(self, value: int, message: str) -> None:
+        if value - self.last >= self.min_delta or value >= 100:
+            self.status.text(message)
+            self.bar.progress(value)
+            self.last = value
+
 
 st.title("Macro Data Downloader (IMF DataMapper + World Bank)")
 
 st.write(
     "Click the button to pull IMF DataMapper and World Bank annual macro data "
     "for the predefined country set and download everything as a single Excel file "
-    "(one sheet per dataset)."
+    "(one sheet per dataset) or a zip of CSV files."
 )
 
 use_sample_countries = st.checkbox(
@@ -22,6 +160,20 @@ use_sample_countries = st.checkbox(
     value=True,
 )
 
+max_workers = st.sidebar.slider(
+    "Parallel requests",
+    min_value=1,
+    max_value=16,
+    value=8,
+    help="Lower this if the IMF or World Bank APIs start rate-limiting.",
+)
+
+output_format = st.sidebar.radio(
+    "Output format",
+    tuple(OUTPUT_FORMATS),
+    help="csv.zip is much faster to build for large pulls.",
+)
+
 if st.button("Fetch and export data"):
     progress = st.progress(0)
     status_text = st.empty()
@@ -29,114 +181,91 @@ if st.button("Fetch and export data"):
     try:
         # 1) Country lookup
         status_text.text("Building country table...")
-        countries = build_country_table()
-        countries = countries[countries["iso2"].notna() & countries["iso3"].notna()]
+        countries = cached_countries(use_sample_countries)
 
-        if use_sample_countries:
-            sample_iso3 = ["ARG", "BRA", "ZAF"]
-            countries = countries[countries["iso3"].isin(sample_iso3)]
-
-        iso3 = countries["iso3"].tolist()
+        iso3 = countries["iso3"].cat.categories.tolist()
         if not iso3:
             st.error("No valid ISO3 country codes found.")
             st.stop()
 
         progress.progress(10)
 
-        # 2) IMF DataMapper: WEO real GDP growth (NGDP_RPCH)
-        status_text.text("Fetching IMF WEO real GDP growth (NGDP_RPCH)...")
-        df_imf_gdp = fetch_imf_gdp_growth_weo(
-            iso3_list=iso3,
-            start_year=1990,
-            end_year=2025,
-        )
-        progress.progress(25)
-
-        # 3) IMF DataMapper: WEO CPI inflation (PCPIPCH)
-        status_text.text("Fetching IMF WEO CPI inflation (PCPIPCH)...")
-        df_imf_cpi = fetch_imf_cpi_inflation_weo(
-            iso3_list=iso3,
-            start_year=1990,
-            end_year=2025,
-        )
-        progress.progress(40)
-
-        # 4) World Bank: GDP growth (NY.GDP.MKTP.KD.ZG)
-        status_text.text("Fetching World Bank GDP growth (NY.GDP.MKTP.KD.ZG)...")
-        df_wb_gdp_g = wb_fetch_indicator(
-            indicator="NY.GDP.MKTP.KD.ZG",
-            iso3_list=iso3,
-            start_year=1990,
-            end_year=2025,
-        )
-        progress.progress(55)
-
-        # 5) World Bank: current account balance (% of GDP)
-        status_text.text("Fetching World Bank current account (BN.CAB.XOKA.GD.ZS)...")
-        df_wb_ca = wb_fetch_indicator(
-            indicator="BN.CAB.XOKA.GD.ZS",
-            iso3_list=iso3,
-            start_year=1990,
-            end_year=2025,
-        )
-        progress.progress(65)
-
-        # 6) World Bank: FDI net inflows (% of GDP)
-        status_text.text("Fetching World Bank FDI net inflows (BX.KLT.DINV.WD.GD.ZS)...")
-        df_wb_fdi = wb_fetch_indicator(
-            indicator="BX.KLT.DINV.WD.GD.ZS",
-            iso3_list=iso3,
-            start_year=1990,
-            end_year=2025,
-        )
-        progress.progress(75)
-
-        # 7) World Bank: reserves in months of imports
-        status_text.text("Fetching World Bank reserves (FI.RES.TOTL.MO)...")
-        df_wb_reserves = wb_fetch_indicator(
-            indicator="FI.RES.TOTL.MO",
-            iso3_list=iso3,
-            start_year=1990,
-            end_year=2025,
-        )
-        progress.progress(85)
-
-        # 8) World Bank: government debt (% of GDP)
-        status_text.text("Fetching World Bank government debt (GC.DOD.TOTL.GD.ZS)...")
-        df_wb_debt = wb_fetch_indicator(
-            indicator="GC.DOD.TOTL.GD.ZS",
-            iso3_list=iso3,
-            start_year=1990,
-            end_year=2025,
-        )
-        progress.progress(95)
-
-        # 9) Build Excel workbook in memory
-        status_text.text("Writing data to Excel workbook...")
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-            countries.to_excel(writer, sheet_name="countries", index=False)
-            df_imf_gdp.to_excel(writer, sheet_name="imf_weo_gdp_growth", index=False)
-            df_imf_cpi.to_excel(writer, sheet_name="imf_weo_cpi_inflation", index=False)
-            df_wb_gdp_g.to_excel(writer, sheet_name="wb_gdp_growth", index=False)
-            df_wb_ca.to_excel(writer, sheet_name="wb_current_account", index=False)
-            df_wb_fdi.to_excel(writer, sheet_name="wb_fdi", index=False)
-            df_wb_reserves.to_excel(writer, sheet_name="wb_reserves", index=False)
-            df_wb_debt.to_excel(writer, sheet_name="wb_debt", index=False)
+        # 2) IMF DataMapper + World Bank pulls, run concurrently: none of them
+        #    depend on each other, so wall time is bounded by the slowest call.
+        status_text.text("Fetching IMF WEO and World Bank series...")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                # IMF calls are fanned out in chunks of countries so a long
+                # country list neither becomes one slow response nor pays a
+                # round trip per country (same chunking as
+                # imf_dm_fetch_indicator_batched, but each chunk is cached).
+                chunks = chunk_area_codes(iso3, IMF_CHUNK_SIZE)
+                futures = {}
+                for i, chunk in enumerate(chunks):
+                    for indicator, sheet_name in IMF_JOBS:
+                        futures[executor.submit(
+                            cached_imf, indicator, chunk, START_YEAR, END_YEAR
+                        )] = (sheet_name, i)
+                for indicator, sheet_name in WB_JOBS:
+                    futures[executor.submit(
+                        cached_wb, indicator, tuple(iso3), START_YEAR, END_YEAR
+                    )] = (sheet_name, 0)
 
-        output.seek(0)
+                # Slots in chunk order, so row order (and the export cache key)
+                # doesn't depend on which request finished first.
+                frames = {sheet_name: [None] * len(chunks) for _, sheet_name in IMF_JOBS}
+                frames.update({sheet_name: [None] for _, sheet_name in WB_JOBS})
+                throttled = _ThrottledProgress(progress, status_text, start=10)
+                for done, future in enumerate(as_completed(futures), start=1):
+                    sheet_name, i = futures[future]
+                    frames[sheet_name][i] = future.result()
+                    throttled.update(
+                        10 + int(85 * done / len(futures)),
+                        f"Fetched {sheet_name} ({done}/{len(futures)})...",
+                    )
+            except BaseException:
+                # Drop the requests still queued instead of letting the `with`
+                # block wait for all of them before the error is shown.
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        sheets = {"countries": countries}
+        for _, sheet_name in IMF_JOBS:
+            sheets[sheet_name] = concat_dm_frames(frames[sheet_name])
+        for _, sheet_name in WB_JOBS:
+            (df,) = frames[sheet_name]
+            # Country columns repeat for every year; store them as categoricals.
+            sheets[sheet_name] = df.astype(
+                {c: "category" for c in WB_CATEGORY_COLUMNS if c in df}
+            )
+
+        # 3) Build the export file (reused across reruns for the same pull)
+        if output_format == "xlsx":
+            status_text.text("Writing data to Excel workbook...")
+            largest = max(len(df) for df in sheets.values())
+            if largest > XLSX_ROW_WARNING:
+                st.warning(
+                    f"Largest sheet has {largest:,} rows; writing xlsx will be slow. "
+                    "Consider the csv.zip output format instead."
+                )
+        else:
+            status_text.text("Writing data to zipped CSV files...")
+        key = tuple((name, _content_hash(df)) for name, df in sheets.items())
+        blob = build_export(key, output_format, sheets)
         progress.progress(100)
 
         st.success("Data pull complete.")
+        file_name = f"macro_data_panel.{output_format}"
         st.download_button(
-            label="Download macro_data_panel.xlsx",
-            data=output,
-            file_name="macro_data_panel.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            label=f"Download {file_name}",
+            data=blob,
+            file_name=file_name,
+            mime=OUTPUT_FORMATS[output_format][1],
+            on_click="ignore",  # downloading shouldn't rerun the whole pull
         )
 
         st.subheader("IMF WEO GDP growth sample (first 10 rows)")
-        st.dataframe(df_imf_gdp.head(10))
+        st.dataframe(sheets["imf_weo_gdp_growth"].head(10))
 
     except Exception as e:
         status_text.text("Error during data fetch.")
@@ -0,0 +1,122 @@
+# Generated offline by resolving every non-override RAW_COUNTRIES entry with
+# macro_data_api.resolve_country (pycountry 26.2.16). Lets the default country
+# table be built without importing pycountry; regenerate when RAW_COUNTRIES
+# changes (names missing here still fall back to pycountry).
+from typing import Dict, Tuple
+
+STATIC_COUNTRY_TABLE: Dict[str, Tuple[str, str, str]] = {
+    "Afghanistan": ("AF", "AFG", "Afghanistan"),
+    "Albania": ("AL", "ALB", "Albania"),
+    "Argentina": ("AR", "ARG", "Argentina"),
+    "Armenia": ("AM", "ARM", "Armenia"),
+    "Austria": ("AT", "AUT", "Austria"),
+    "Azerbaijan": ("AZ", "AZE", "Azerbaijan"),
+    "Burundi": ("BI", "BDI", "Burundi"),
+    "Belgium": ("BE", "BEL", "Belgium"),
+    "Burkina Faso": ("BF", "BFA", "Burkina Faso"),
+    "Bangladesh": ("BD", "BGD", "Bangladesh"),
+    "Bulgaria": ("BG", "BGR", "Bulgaria"),
+    "Bahrain": ("BH", "BHR", "Bahrain"),
+    "Belarus": ("BY", "BLR", "Belarus"),
+    "Bolivia": ("BO", "BOL", "Bolivia, Plurinational State of"),
+    "Brazil": ("BR", "BRA", "Brazil"),
+    "Canada": ("CA", "CAN", "Canada"),
+    "Switzerland": ("CH", "CHE", "Switzerland"),
+    "Chile": ("CL", "CHL", "Chile"),
+    "Cameroon": ("CM", "CMR", "Cameroon"),
+    "Colombia": ("CO", "COL", "Colombia"),
+    "Cyprus": ("CY", "CYP", "Cyprus"),
+    "Czech Republic": ("CZ", "CZE", "Czechia"),
+    "Germany": ("DE", "DEU", "Germany"),
+    "Denmark": ("DK", "DNK", "Denmark"),
+    "Algeria": ("DZ", "DZA", "Algeria"),
+    "Ecuador": ("EC", "ECU", "Ecuador"),
+    "Egypt": ("EG", "EGY", "Egypt"),
+    "Spain": ("ES", "ESP", "Spain"),
+    "Estonia": ("EE", "EST", "Estonia"),
+    "Ethiopia": ("ET", "ETH", "Ethiopia"),
+    "Finland": ("FI", "FIN", "Finland"),
+    "France": ("FR", "FRA", "France"),
+    "United Kingdom": ("GB", "GBR", "United Kingdom"),
+    "Georgia": ("GE", "GEO", "Georgia"),
+    "Ghana": ("GH", "GHA", "Ghana"),
+    "Guinea": ("GN", "GIN", "Guinea"),
+    "Greece": ("GR", "GRC", "Greece"),
+    "Guatemala": ("GT", "GTM", "Guatemala"),
+    "Honduras": ("HN", "HND", "Honduras"),
+    "Haiti": ("HT", "HTI", "Haiti"),
+    "Hungary": ("HU", "HUN", "Hungary"),
+    "Indonesia": ("ID", "IDN", "Indonesia"),
+    "India": ("IN", "IND", "India"),
+    "Iran": ("IR", "IRN", "Iran, Islamic Republic of"),
+    "Iraq": ("IQ", "IRQ", "Iraq"),
+    "Israel": ("IL", "ISR", "Israel"),
+    "Italy": ("IT", "ITA", "Italy"),
+    "Jamaica": ("JM", "JAM", "Jamaica"),
+    "Jordan": ("JO", "JOR", "Jordan"),
+    "Kazakhstan": ("KZ", "KAZ", "Kazakhstan"),
+    "Kenya": ("KE", "KEN", "Kenya"),
+    "Kyrgyz Republic": ("KG", "KGZ", "Kyrgyzstan"),
+    "Cambodia": ("KH", "KHM", "Cambodia"),
+    "Kuwait": ("KW", "KWT", "Kuwait"),
+    "Lebanon": ("LB", "LBN", "Lebanon"),
+    "Libya": ("LY", "LBY", "Libya"),
+    "Sri Lanka": ("LK", "LKA", "Sri Lanka"),
+    "Lithuania": ("LT", "LTU", "Lithuania"),
+    "Latvia": ("LV", "LVA", "Latvia"),
+    "Morocco": ("MA", "MAR", "Morocco"),
+    "Moldova": ("MD", "MDA", "Moldova, Republic of"),
+    "Madagascar": ("MG", "MDG", "Madagascar"),
+    "Mexico": ("MX", "MEX", "Mexico"),
+    "Mali": ("ML", "MLI", "Mali"),
+    "Myanmar": ("MM", "MMR", "Myanmar"),
+    "Mauritania": ("MR", "MRT", "Mauritania"),
+    "Malawi": ("MW", "MWI", "Malawi"),
+    "Malaysia": ("MY", "MYS", "Malaysia"),
+    "Niger": ("NE", "NER", "Niger"),
+    "Nigeria": ("NG", "NGA", "Nigeria"),
+    "Nicaragua": ("NI", "NIC", "Nicaragua"),
+    "Netherlands": ("NL", "NLD", "Netherlands"),
+    "Nepal": ("NP", "NPL", "Nepal"),
+    "New Zealand": ("NZ", "NZL", "New Zealand"),
+    "Pakistan": ("PK", "PAK", "Pakistan"),
+    "Panama": ("PA", "PAN", "Panama"),
+    "Peru": ("PE", "PER", "Peru"),
+    "Philippines": ("PH", "PHL", "Philippines"),
+    "Papua New Guinea": ("PG", "PNG", "Papua New Guinea"),
+    "Poland": ("PL", "POL", "Poland"),
+    "Puerto Rico": ("PR", "PRI", "Puerto Rico"),
+    "Portugal": ("PT", "PRT", "Portugal"),
+    "Paraguay": ("PY", "PRY", "Paraguay"),
+    "Qatar": ("QA", "QAT", "Qatar"),
+    "Romania": ("RO", "ROU", "Romania"),
+    "Russia": ("RU", "RUS", "Russian Federation"),
+    "Rwanda": ("RW", "RWA", "Rwanda"),
+    "Saudi Arabia": ("SA", "SAU", "Saudi Arabia"),
+    "Sudan": ("SD", "SDN", "Sudan"),
+    "Senegal": ("SN", "SEN", "Senegal"),
+    "El Salvador": ("SV", "SLV", "El Salvador"),
+    "Somalia": ("SO", "SOM", "Somalia"),
+    "Serbia": ("RS", "SRB", "Serbia"),
+    "Slovak Republic": ("SK", "SVK", "Slovakia"),
+    "Slovenia": ("SI", "SVN", "Slovenia"),
+    "Sweden": ("SE", "SWE", "Sweden"),
+    "Eswatini": ("SZ", "SWZ", "Eswatini"),
+    "Syria": ("SY", "SYR", "Syrian Arab Republic"),
+    "Chad": ("TD", "TCD", "Chad"),
+    "Togo": ("TG", "TGO", "Togo"),
+    "Thailand": ("TH", "THA", "Thailand"),
+    "Tajikistan": ("TJ", "TJK", "Tajikistan"),
+    "Tunisia": ("TN", "TUN", "Tunisia"),
+    "Tanzania": ("TZ", "TZA", "Tanzania, United Republic of"),
+    "Uganda": ("UG", "UGA", "Uganda"),
+    "Ukraine": ("UA", "UKR", "Ukraine"),
+    "United States": ("US", "USA", "United States"),
+    "Uzbekistan": ("UZ", "UZB", "Uzbekistan"),
+    "Venezuela": ("VE", "VEN", "Venezuela, Bolivarian Republic of"),
+    "Vietnam": ("VN", "VNM", "Viet Nam"),
+    "Yemen": ("YE", "YEM", "Yemen"),
+    "South Africa": ("ZA", "ZAF", "South Africa"),
+    "Zambia": ("ZM", "ZMB", "Zambia"),
+    "Zimbabwe": ("ZW", "ZWE", "Zimbabwe"),
+}
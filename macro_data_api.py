@@ -1,12 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import requests
-import pandas as pd
-import pycountry
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional, Any
+from datetime import timedelta
+from typing import TYPE_CHECKING, List, Dict, FrozenSet, Tuple, Optional, Any, Iterable, Union
+
+from country_table_static import STATIC_COUNTRY_TABLE
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON decoding
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # optional: on-disk HTTP response cache
+    requests_cache = None
+
+try:
+    import aiohttp
+except ImportError:  # optional: asyncio variants of the fetchers
+    aiohttp = None
+
+# pandas (and pyarrow) are imported inside the functions that build frames, so
+# importing this module for its constants or country lookups doesn't pay their
+# startup cost.
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# ---- 0. Shared HTTP session ----
+
+# One keep-alive connection pool for every IMF / World Bank call, so repeated
+# requests (WB pages, per-country IMF pulls) skip the TCP + TLS handshake.
+# With requests-cache installed, identical GETs are also answered from a local
+# SQLite cache: WEO and WB series only change a few times a year.
+HTTP_CACHE_EXPIRE_AFTER = timedelta(hours=12)
+# DataMapper metadata (indicator list, countries/regions/groups) already has
+# its own cache layer (in memory and on disk, see IMF_DM_METADATA_TTL), so
+# those URLs bypass the HTTP cache: a TTL refresh must reach the API rather
+# than be answered with a copy that could itself be a day old. Patterns are
+# matched as URL prefixes.
+_HTTP_CACHE_METADATA_URLS = tuple(
+    f"www.imf.org/external/datamapper/api/v1/{endpoint}"
+    for endpoint in ("indicators", "countries", "regions", "groups")
+)
+
+if requests_cache is not None:
+    _SESSION = requests_cache.CachedSession(
+        "macro_cache",
+        backend="sqlite",
+        expire_after=HTTP_CACHE_EXPIRE_AFTER,
+        urls_expire_after={
+            url: requests_cache.DO_NOT_CACHE for url in _HTTP_CACHE_METADATA_URLS
+        },
+        allowable_methods=("GET",),
+    )
+else:
+    _SESSION = requests.Session()
+# Shared by the sync session's urllib3 Retry and the async fetchers.
+HTTP_RETRY_TOTAL = 3
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=HTTP_RETRY_TOTAL,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        raise_on_status=False,  # let raise_for_status() report the final error
+    ),
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+# requests already advertises gzip/deflate, plus br once `brotli` (listed in
+# requirements.txt) is importable, and decompresses transparently; only the
+# content type needs pinning.
+_SESSION.headers.update({"Accept": "application/json"})
+
+
+def _loads(body: bytes) -> Any:
+    # Both parsers read the raw bytes directly, skipping a charset detection
+    # and str decode; orjson is just faster at it.
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _json(resp: requests.Response) -> Any:
+    return _loads(resp.content)
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_area_codes(codes: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(sorted({c.strip().upper() for c in codes if c}))
+
+
+def normalize_area_codes(codes: Iterable[str]) -> Tuple[str, ...]:
+    # Deduplicated, upper-cased and sorted, so the same country set always
+    # produces the same URL (and the same HTTP cache key). Results are cached
+    # per input tuple; tuples (e.g. from chunk_area_codes) are used as-is.
+    return _normalize_area_codes(codes if isinstance(codes, tuple) else tuple(codes))
+
+
+def _area_key(codes: Iterable[str], sep: str) -> str:
+    # URL segment for an area set.
+    return sep.join(normalize_area_codes(codes))
+
+
+@dataclass
+class _ObsBuffer:
+    """Structure-of-arrays accumulator: one list per output column."""
+
+    columns: Dict[str, List[Any]]
+
+    @classmethod
+    def with_columns(cls, *names: str) -> "_ObsBuffer":
+        return cls({name: [] for name in names})
+
+    def extend(self, **values: Iterable[Any]) -> None:
+        for name, vals in values.items():
+            self.columns[name].extend(vals)
+
+    def to_df(self) -> pd.DataFrame:
+        import pandas as pd
+        # Columns go straight into the frame; no per-row dict/tuple transpose.
+        return pd.DataFrame(self.columns, copy=False)
+
 
 # ---- 1. Country mapping ----
 
-RAW_COUNTRIES = [
+RAW_COUNTRIES: Tuple[str, ...] = (
     'Afghanistan', 'Albania', 'Argentina', 'Armenia', 'Austria',
     'Azerbaijan', 'Burundi', 'Belgium', 'Burkina Faso', 'Bangladesh',
     'Bulgaria', 'Bahrain', 'Belarus', 'Bolivia', 'Brazil', 'Canada',
@@ -20,7 +157,7 @@ RAW_COUNTRIES = [
     'Jamaica', 'Jordan', 'Kazakhstan', 'Kenya', 'Kyrgyz Republic',
     'Cambodia', 'Korea', 'Kosovo', 'Kuwait', 'Lebanon', 'Libya',
     'Sri Lanka', 'Lithuania', 'Latvia', 'Morocco', 'Moldova',
-    'Madagascar', 'Mexico', 'North Macedonia ', 'Mali', 'Myanmar',
+    'Madagascar', 'Mexico', 'North Macedonia', 'Mali', 'Myanmar',
     'Montenegro, Rep. of', 'Mauritania', 'Malawi', 'Malaysia', 'Niger',
     'Nigeria', 'Nicaragua', 'Netherlands', 'Nepal', 'New Zealand',
     'Pakistan', 'Panama', 'Peru', 'Philippines', 'Papua New Guinea',
@@ -32,7 +169,10 @@ RAW_COUNTRIES = [
     'Taiwan Province of China', 'Tanzania', 'Uganda', 'Ukraine',
     'United States', 'Uzbekistan', 'Venezuela', 'Vietnam',
     'West Bank & Gaza', 'Yemen', 'South Africa', 'Zambia', 'Zimbabwe'
-]
+)
+
+# O(1) membership checks against the default country list.
+RAW_COUNTRIES_SET: FrozenSet[str] = frozenset(RAW_COUNTRIES)
 
 MANUAL_COUNTRY_OVERRIDES: Dict[str, Tuple[str, str, str]] = {
     "China (inc. Hong Kong SAR results)": ("CN", "CHN", "China"),
@@ -44,11 +184,12 @@ MANUAL_COUNTRY_OVERRIDES: Dict[str, Tuple[str, str, str]] = {
     "West Bank & Gaza": ("PS", "PSE", "Palestine, State of"),
     "Korea": ("KR", "KOR", "Korea, Republic of"),
     "Kosovo": ("XK", "XKX", "Kosovo"),
-    "North Macedonia ": ("MK", "MKD", "North Macedonia"),
+    "North Macedonia": ("MK", "MKD", "North Macedonia"),
+    "Turkey": ("TR", "TUR", "Türkiye"),
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class CountryCode:
     raw_name: str
     iso2: str
@@ -56,59 +197,132 @@ class CountryCode:
     official_name: str
 
 
+def _normalize_name(raw: str) -> str:
+    return raw.strip().rstrip(".").casefold()
+
+
+# One normalized-name probe covers both pre-resolved tables; overrides win.
+_NAME_INDEX: Dict[str, Tuple[str, str, str]] = {
+    _normalize_name(name): codes
+    for table in (STATIC_COUNTRY_TABLE, MANUAL_COUNTRY_OVERRIDES)
+    for name, codes in table.items()
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_codes(key: str) -> Tuple[str, str, str]:
+    # Keyed on the normalized name, so case/spacing variants share one entry.
+    known = _NAME_INDEX.get(key)
+    if known is not None:
+        return known
+    # Not pre-resolved: pycountry is only imported (a ~1MB ISO database) here.
+    import pycountry
+
+    # lookup() probes pycountry's case-insensitive indexes (codes, name,
+    # official and common name); only fall back to the (slow, full-table)
+    # fuzzy search when it misses.
+    try:
+        match = pycountry.countries.lookup(key)
+    except LookupError:
+        match = pycountry.countries.search_fuzzy(key)[0]
+    return (match.alpha_2, match.alpha_3, match.name)
+
+
 def resolve_country(raw_name: str) -> CountryCode:
-    raw = raw_name.strip()
-    if raw in MANUAL_COUNTRY_OVERRIDES:
-        iso2, iso3, official = MANUAL_COUNTRY_OVERRIDES[raw]
-        return CountryCode(raw_name=raw_name, iso2=iso2, iso3=iso3, official_name=official)
-    match = pycountry.countries.search_fuzzy(raw)[0]
-    return CountryCode(
-        raw_name=raw_name,
-        iso2=match.alpha_2,
-        iso3=match.alpha_3,
-        official_name=match.name,
-    )
+    iso2, iso3, official = _resolve_codes(_normalize_name(raw_name))
+    return CountryCode(raw_name=raw_name, iso2=iso2, iso3=iso3, official_name=official)
+
+
+_COUNTRY_TABLE_COLUMNS = ("raw_name", "iso2", "iso3", "official_name")
+
+
+def _country_row(raw_name: str) -> Tuple[Optional[str], ...]:
+    # Same order as _COUNTRY_TABLE_COLUMNS.
+    try:
+        c = resolve_country(raw_name)
+        return (c.raw_name, c.iso2, c.iso3, c.official_name)
+    except Exception as exc:
+        return (raw_name, None, None, f"UNRESOLVED: {exc}")
+
+
+# Resolved once at import; the default table never needs fuzzy matching again.
+_DEFAULT_COUNTRY_ROWS = [_country_row(n) for n in RAW_COUNTRIES]
+
+# Plain code lookups for callers that don't need a DataFrame (unresolved
+# names are left out).
+ISO2_BY_RAW: Dict[str, str] = {raw: iso2 for raw, iso2, _, _ in _DEFAULT_COUNTRY_ROWS if iso2}
+ISO3_BY_RAW: Dict[str, str] = {raw: iso3 for raw, _, iso3, _ in _DEFAULT_COUNTRY_ROWS if iso3}
+
+
+def _rows_to_country_table(rows: List[Tuple[Optional[str], ...]]) -> pd.DataFrame:
+    import pandas as pd
+    # Tuple records with declared columns skip the per-row dict key handling.
+    return pd.DataFrame.from_records(rows, columns=list(_COUNTRY_TABLE_COLUMNS))
+
+
+@functools.lru_cache(maxsize=1)
+def _default_country_table() -> pd.DataFrame:
+    # Built on first use rather than at import, so pandas stays a lazy import.
+    return _rows_to_country_table(_DEFAULT_COUNTRY_ROWS)
 
 
 def build_country_table(raw_names: Optional[List[str]] = None) -> pd.DataFrame:
     if raw_names is None:
-        raw_names = RAW_COUNTRIES
-    rows = []
-    for n in raw_names:
-        try:
-            c = resolve_country(n)
-            rows.append(
-                {
-                    "raw_name": c.raw_name,
-                    "iso2": c.iso2,
-                    "iso3": c.iso3,
-                    "official_name": c.official_name,
-                }
-            )
-        except Exception as exc:
-            rows.append(
-                {
-                    "raw_name": n,
-                    "iso2": None,
-                    "iso3": None,
-                    "official_name": f"UNRESOLVED: {exc}",
-                }
-            )
-    return pd.DataFrame(rows)
+        # Copy, so callers can't mutate the shared table.
+        return _default_country_table().copy()
+    return _rows_to_country_table([_country_row(n) for n in raw_names])
 
 
 # ---- 2. IMF DataMapper API helpers ----
 
 IMF_DM_BASE_URL = "https://www.imf.org/external/datamapper/api/v1"
 
-_IMF_DM_REFAREAS_CACHE: Optional[pd.DataFrame] = None
-
+_IMF_DM_INDICATORS_CACHE: Optional[pd.DataFrame] = None
+_IMF_DM_INDICATORS_LOADED_AT = 0.0
+_IMF_DM_INDICATORS_LOCK = threading.Lock()
 
-def imf_dm_get_indicators() -> pd.DataFrame:
+_IMF_DM_REFAREAS_CACHE: Optional[pd.DataFrame] = None
+_IMF_DM_REFAREAS_LOADED_AT = 0.0
+_IMF_DM_REFAREAS_LOCK = threading.Lock()
+# (ref-area table, the same table indexed by code) for label/type lookups.
+_IMF_DM_REFAREAS_BY_CODE: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None
+
+# Indicators and ref areas change on the order of years; refresh the
+# in-memory copies once a day so long-running processes (the Streamlit app)
+# pick up changes. Ref areas are also kept on disk so fresh processes skip
+# the three metadata requests. This is the only TTL for metadata: the HTTP
+# cache does not store these responses, so data is at most a day old.
+IMF_DM_METADATA_TTL = timedelta(hours=24)
+IMF_DM_REFAREAS_DISK_CACHE = Path.home() / ".cache" / "macro_data_api" / "ref_areas.parquet"
+
+
+def _read_ref_areas_disk_cache() -> Optional[pd.DataFrame]:
+    import pandas as pd
+    path = IMF_DM_REFAREAS_DISK_CACHE
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age > IMF_DM_METADATA_TTL.total_seconds():
+            return None
+        return pd.read_parquet(path)
+    except Exception:
+        return None  # missing, unreadable or stale: refetch
+
+
+def _write_ref_areas_disk_cache(ref_df: pd.DataFrame) -> None:
+    path = IMF_DM_REFAREAS_DISK_CACHE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        ref_df.to_parquet(path, index=False)
+    except Exception:
+        pass  # the disk copy is only an optimization
+
+
+def _fetch_indicators() -> pd.DataFrame:
+    import pandas as pd
     url = f"{IMF_DM_BASE_URL}/indicators"
-    resp = requests.get(url, timeout=60)
+    resp = _SESSION.get(url, timeout=60)
     resp.raise_for_status()
-    data = resp.json()
+    data = _json(resp)
     indicators = []
     for code, meta in data.get("indicators", {}).items():
         row = {"indicator": code}
@@ -118,108 +332,262 @@ def imf_dm_get_indicators() -> pd.DataFrame:
     return pd.DataFrame(indicators)
 
 
-def imf_dm_ref_areas() -> pd.DataFrame:
-    global _IMF_DM_REFAREAS_CACHE
-    if _IMF_DM_REFAREAS_CACHE is not None:
+def _cached_indicators() -> pd.DataFrame:
+    global _IMF_DM_INDICATORS_CACHE, _IMF_DM_INDICATORS_LOADED_AT
+    with _IMF_DM_INDICATORS_LOCK:
+        age = time.monotonic() - _IMF_DM_INDICATORS_LOADED_AT
+        if _IMF_DM_INDICATORS_CACHE is None or age >= IMF_DM_METADATA_TTL.total_seconds():
+            _IMF_DM_INDICATORS_CACHE = _fetch_indicators()
+            _IMF_DM_INDICATORS_LOADED_AT = time.monotonic()
+        return _IMF_DM_INDICATORS_CACHE
+
+
+def imf_dm_get_indicators() -> pd.DataFrame:
+    # A copy, so a caller editing its frame can't corrupt the shared cache.
+    return _cached_indicators().copy()
+
+
+def _ref_areas_cache_fresh() -> bool:
+    age = time.monotonic() - _IMF_DM_REFAREAS_LOADED_AT
+    return _IMF_DM_REFAREAS_CACHE is not None and age < IMF_DM_METADATA_TTL.total_seconds()
+
+
+def _cached_ref_areas() -> pd.DataFrame:
+    global _IMF_DM_REFAREAS_CACHE, _IMF_DM_REFAREAS_LOADED_AT
+    if _ref_areas_cache_fresh():
         return _IMF_DM_REFAREAS_CACHE
+    # Concurrent first callers (e.g. chunked IMF pulls) wait here instead
+    # of each firing their own three requests.
+    with _IMF_DM_REFAREAS_LOCK:
+        if not _ref_areas_cache_fresh():
+            ref_df = _read_ref_areas_disk_cache()
+            if ref_df is None:
+                ref_df = _fetch_ref_areas()
+                _write_ref_areas_disk_cache(ref_df)
+            _IMF_DM_REFAREAS_CACHE = ref_df
+            _IMF_DM_REFAREAS_LOADED_AT = time.monotonic()
+    return _IMF_DM_REFAREAS_CACHE
 
-    def _fetch(endpoint: str, type_name: str) -> pd.DataFrame:
-        url = f"{IMF_DM_BASE_URL}/{endpoint}"
-        resp = requests.get(url, timeout=60)
-        resp.raise_for_status()
-        data = resp.json()
-        key = endpoint  # 'countries', 'regions', 'groups'
-        items = []
-        for code, meta in data.get(key, {}).items():
-            row = {"code": code, "type": type_name}
-            if isinstance(meta, dict):
-                row.update(meta)
-            items.append(row)
-        return pd.DataFrame(items)
 
-    df_c = _fetch("countries", "country")
-    df_r = _fetch("regions", "region")
-    df_g = _fetch("groups", "group")
+def imf_dm_ref_areas() -> pd.DataFrame:
+    # A copy, so a caller editing its frame can't corrupt the shared cache.
+    return _cached_ref_areas().copy()
 
-    ref_df = pd.concat([df_c, df_r, df_g], ignore_index=True)
-    _IMF_DM_REFAREAS_CACHE = ref_df
-    return ref_df
 
+def _ref_areas_by_code() -> pd.DataFrame:
+    global _IMF_DM_REFAREAS_BY_CODE
+    ref_df = _cached_ref_areas()
+    cached = _IMF_DM_REFAREAS_BY_CODE
+    # Rebuilt only when the ref-area table itself has been (re)loaded.
+    if cached is None or cached[0] is not ref_df:
+        by_code = ref_df.drop_duplicates("code").set_index("code")[["label", "type"]]
+        cached = _IMF_DM_REFAREAS_BY_CODE = (ref_df, by_code)
+    return cached[1]
 
-def imf_dm_fetch_indicator(
-    indicator: str,
-    ref_areas: Optional[List[str]] = None,
-    start_year: Optional[int] = None,
-    end_year: Optional[int] = None,
+
+def _fetch_ref_area_endpoint(
+    session: requests.Session, endpoint: str, type_name: str
 ) -> pd.DataFrame:
-    parts = [indicator]
-    if ref_areas:
-        parts.extend([c.strip().upper() for c in ref_areas if c])
-    path = "/".join(parts)
+    import pandas as pd
+    url = f"{IMF_DM_BASE_URL}/{endpoint}"
+    resp = session.get(url, timeout=60)
+    resp.raise_for_status()
+    data = _json(resp)
+    key = endpoint  # 'countries', 'regions', 'groups'
+    items = []
+    for code, meta in data.get(key, {}).items():
+        row = {"code": code, "type": type_name}
+        if isinstance(meta, dict):
+            row.update(meta)
+        items.append(row)
+    df = pd.DataFrame(items)
+    return df.astype({c: "string" for c in ("code", "label") if c in df})
+
+
+def _fetch_ref_areas() -> pd.DataFrame:
+    import pandas as pd
+    # Three independent endpoints: fetch them concurrently over the shared session.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        frames = list(
+            executor.map(
+                functools.partial(_fetch_ref_area_endpoint, _SESSION),
+                ["countries", "regions", "groups"],
+                ["country", "region", "group"],
+            )
+        )
+    ref_df = pd.concat(frames, ignore_index=True)
+    # Only three distinct values: a categorical is a small fraction of the size.
+    return ref_df.astype({"type": "category"})
+
+
+_DM_CATEGORY_COLUMNS = ("indicator", "refarea", "label", "type")
+# Output schema of imf_dm_fetch_indicator. The id/label columns repeat for
+# every year of a series, so they are categoricals (one small integer code
+# per row). Years fit in int16. Values stay float64: some series (levels in
+# local currency) need more than float32's ~7 significant digits.
+_DM_DTYPES: Dict[str, str] = {
+    "indicator": "category",
+    "refarea": "category",
+    "year": "int16",
+    "value": "float64",
+    "label": "category",
+    "type": "category",
+}
+
+
+def chunk_area_codes(codes: Iterable[str], chunk_size: int) -> List[Tuple[str, ...]]:
+    # Codes are normalized (deduplicated) first, so chunks never overlap and
+    # the same country set always splits into the same requests.
+    codes = normalize_area_codes(codes)
+    return [codes[i:i + chunk_size] for i in range(0, len(codes), chunk_size)]
+
+
+def concat_dm_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    import pandas as pd
+    from pandas.api.types import union_categoricals
+    # pd.concat falls back to object dtype when categories differ between
+    # frames; align every frame on the union of categories first. Empty
+    # frames carry no categories, so they are left out.
+    frames = [f for f in frames if len(f)] or frames[:1]
+    if len(frames) > 1:
+        dtypes = {
+            c: pd.CategoricalDtype(union_categoricals([f[c] for f in frames]).categories)
+            for c in _DM_CATEGORY_COLUMNS
+        }
+        frames = [f.astype(dtypes) for f in frames]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _imf_dm_request(
+    indicator: str,
+    ref_areas: Optional[List[str]],
+    start_year: Optional[int],
+    end_year: Optional[int],
+) -> Tuple[str, Dict[str, Any]]:
+    area_key = _area_key(ref_areas, "/") if ref_areas else ""
+    path = f"{indicator}/{area_key}" if area_key else indicator
     url = f"{IMF_DM_BASE_URL}/{path}"
 
+    # `periods` only takes an explicit year list, so it is sent for a closed
+    # range only. An open-ended range omits it (the API then returns every
+    # year) and the missing bound is applied client-side in _imf_dm_parse.
     params: Dict[str, Any] = {}
-    years = None
     if start_year is not None and end_year is not None:
-        years = list(range(start_year, end_year + 1))
-    elif start_year is not None:
-        years = [start_year]
-    elif end_year is not None:
-        years = [end_year]
+        params["periods"] = ",".join(str(y) for y in range(start_year, end_year + 1))
+    return url, params
 
-    if years:
-        params["periods"] = ",".join(str(y) for y in years)
-
-    resp = requests.get(url, params=params, timeout=60)
-    resp.raise_for_status()
-    js = resp.json()
-
-    values = js.get("values", {})
-    if not values:
-        return pd.DataFrame(columns=["indicator", "refarea", "year", "value", "label", "type"])
 
+def _imf_dm_parse(
+    js: Dict[str, Any],
+    indicator: str,
+    start_year: Optional[int],
+    end_year: Optional[int],
+) -> pd.DataFrame:
+    import pandas as pd
+    values = js.get("values") or {}
     series_dict = values.get(indicator)
     if series_dict is None and values:
         series_dict = next(iter(values.values()))
 
-    rows = []
-    for ref_code, series in series_dict.items():
+    # Extend whole columns per ref area from the nested {refarea: {year: value}}
+    # payload, then convert year/value vectorized instead of per observation.
+    buf = _ObsBuffer.with_columns("refarea", "year", "value")
+    for ref_code, series in (series_dict or {}).items():
         if not isinstance(series, dict):
             continue
-        for year_str, val in series.items():
-            try:
-                year_int = int(year_str)
-            except (TypeError, ValueError):
-                continue
-            if val is None:
-                value = None
-            else:
-                try:
-                    value = float(val)
-                except (TypeError, ValueError):
-                    value = None
-            rows.append(
-                {
-                    "indicator": indicator,
-                    "refarea": ref_code,
-                    "year": year_int,
-                    "value": value,
-                }
-            )
+        buf.extend(
+            refarea=[ref_code] * len(series),
+            year=series.keys(),
+            value=series.values(),
+        )
+    # One frame construction with the columns already converted, rather than
+    # converting and inserting columns into an existing frame.
+    cols = buf.columns
+    df = pd.DataFrame({
+        "indicator": indicator,
+        "refarea": cols["refarea"],
+        "year": pd.to_numeric(cols["year"], errors="coerce"),
+        "value": pd.to_numeric(cols["value"], errors="coerce").astype("float64"),
+    })
+    keep = df["year"].notna()
+    if start_year is not None:
+        keep &= df["year"] >= start_year
+    if end_year is not None:
+        keep &= df["year"] <= end_year
+    df = df[keep]
 
-    df = pd.DataFrame(rows)
     if df.empty:
-        return df.assign(label=pd.NA, type=pd.NA)
-
-    ref_table = imf_dm_ref_areas()
-    df = df.merge(
-        ref_table[["code", "label", "type"]],
-        how="left",
-        left_on="refarea",
-        right_on="code",
-    )
-    df = df.drop(columns=["code"])
-    return df[["indicator", "refarea", "year", "value", "label", "type"]]
+        df = df.assign(label=pd.NA, type=pd.NA)
+    else:
+        # Hash lookups against the code-indexed table instead of a merge: no
+        # join frame, and label/type keep the ref table's values.
+        by_code = _ref_areas_by_code()
+        df = df.assign(
+            label=df["refarea"].map(by_code["label"]),
+            type=df["refarea"].map(by_code["type"]),
+        )
+    # Same schema whether or not there was data, so concatenating chunks
+    # never falls back to object columns.
+    return df.astype(_DM_DTYPES)
+
+
+def _to_arrow_table(df: pd.DataFrame) -> pa.Table:
+    import pyarrow as pa
+    # Categoricals become dictionary-encoded arrays and numeric columns are
+    # handed over without a copy, so Parquet/DuckDB/Polars consumers never
+    # touch per-cell Python objects.
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def imf_dm_fetch_indicator(
+    indicator: str,
+    ref_areas: Optional[List[str]] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    as_arrow: bool = False,
+) -> Union[pd.DataFrame, pa.Table]:
+    url, params = _imf_dm_request(indicator, ref_areas, start_year, end_year)
+    resp = _SESSION.get(url, params=params, timeout=60)
+    resp.raise_for_status()
+    df = _imf_dm_parse(_json(resp), indicator, start_year, end_year)
+    return _to_arrow_table(df) if as_arrow else df
+
+
+def imf_dm_fetch_indicators(
+    indicators: List[str],
+    ref_areas: Optional[List[str]] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+) -> Dict[str, pd.DataFrame]:
+    # The DataMapper URL only takes one indicator, so several indicators can't
+    # share a request; issue them concurrently over the pooled session instead.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(indicators)))) as executor:
+        frames = executor.map(
+            lambda ind: imf_dm_fetch_indicator(ind, ref_areas, start_year, end_year),
+            indicators,
+        )
+        return dict(zip(indicators, frames))
+
+
+def imf_dm_fetch_indicator_batched(
+    indicator: str,
+    ref_areas: List[str],
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    chunk_size: int = 10,
+    max_workers: int = 6,
+) -> pd.DataFrame:
+    # Long area lists become a few mid-sized requests fetched concurrently
+    # instead of one huge response on a single connection.
+    chunks = chunk_area_codes(ref_areas, chunk_size)
+    if len(chunks) <= 1:
+        return imf_dm_fetch_indicator(indicator, chunks[0] if chunks else None, start_year, end_year)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+        frames = list(executor.map(
+            lambda chunk: imf_dm_fetch_indicator(indicator, chunk, start_year, end_year),
+            chunks,
+        ))
+    return concat_dm_frames(frames)
 
 
 def fetch_imf_gdp_growth_weo(
@@ -254,14 +622,14 @@ def fetch_imf_cpi_inflation_weo(
 WB_BASE_URL = "https://api.worldbank.org/v2"
 
 
-def wb_fetch_indicator(
+def _wb_request(
     indicator: str,
-    iso3_list: Optional[List[str]] = None,
-    start_year: Optional[int] = None,
-    end_year: Optional[int] = None,
-) -> pd.DataFrame:
+    iso3_list: Optional[List[str]],
+    start_year: Optional[int],
+    end_year: Optional[int],
+) -> Tuple[str, Dict[str, Any]]:
     if iso3_list:
-        country_str = ";".join(code.upper() for code in iso3_list)
+        country_str = _area_key(iso3_list, ";")
     else:
         country_str = "all"
 
@@ -275,50 +643,188 @@ def wb_fetch_indicator(
             params["date"] = f"{start_year}:"
         else:
             params["date"] = f":{end_year}"
+    return url, params
+
+
+def _wb_buffer() -> _ObsBuffer:
+    return _ObsBuffer.with_columns("country", "iso3", "indicator", "date", "value")
+
+
+def _wb_add_page(buf: _ObsBuffer, indicator: str, payload: Any, page: int) -> Dict[str, Any]:
+    # A good page is [meta, rows]. API errors (bad indicator or country
+    # code) come back with HTTP 200 as [{"message": [...]}]; raise instead
+    # of quietly returning an empty or truncated frame.
+    if not isinstance(payload, list) or not payload or not isinstance(payload[0], dict):
+        raise ValueError(f"World Bank {indicator}: unexpected response for page {page}")
+    meta = payload[0]
+    if "message" in meta:
+        details = "; ".join(str(m.get("value", m)) for m in meta["message"])
+        raise ValueError(f"World Bank {indicator}: {details}")
+    data = payload[1] if len(payload) > 1 else None
+    if data is None:
+        if page > 1:
+            raise ValueError(f"World Bank {indicator}: page {page} has no data")
+        return meta  # no observations at all
+    buf.extend(
+        country=[obs["country"]["value"] for obs in data],
+        iso3=[obs["countryiso3code"] for obs in data],
+        indicator=[obs["indicator"]["id"] for obs in data],
+        date=[obs["date"] for obs in data],
+        value=[obs["value"] for obs in data],
+    )
+    return meta
 
-    rows = []
-    page = 1
-    while True:
-        params["page"] = page
-        resp = requests.get(url, params=params, timeout=60)
-        resp.raise_for_status()
-        payload = resp.json()
-        if not payload or len(payload) < 2 or payload[1] is None:
-            break
-        meta, data = payload
-        for obs in data:
-            rows.append(
-                {
-                    "country": obs["country"]["value"],
-                    "iso3": obs["countryiso3code"],
-                    "indicator": obs["indicator"]["id"],
-                    "date": obs["date"],
-                    "value": obs["value"],
-                }
-            )
-        total_pages = int(meta.get("pages", 1))
-        if page >= total_pages:
-            break
-        page += 1
-
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df["date"] = pd.to_numeric(df["date"], errors="coerce").astype("Int64")
+
+def _wb_frame(buf: _ObsBuffer) -> pd.DataFrame:
+    import pandas as pd
+    df = buf.to_df()
+    # Same schema whether or not the pull returned rows.
+    df["date"] = pd.to_numeric(df["date"], errors="coerce").astype("Int16")
+    df["value"] = pd.to_numeric(df["value"], errors="coerce").astype("float64")
+    if df.empty:
+        # No values to infer the text columns from: use the string dtype a
+        # non-empty pull gets.
+        df = df.astype({c: "str" for c in ("country", "iso3", "indicator")})
     return df
 
 
+def wb_fetch_indicator(
+    indicator: str,
+    iso3_list: Optional[List[str]] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    max_workers: int = 8,
+) -> pd.DataFrame:
+    url, params = _wb_request(indicator, iso3_list, start_year, end_year)
+
+    def _get_page(page: int) -> Any:
+        resp = _SESSION.get(url, params={**params, "page": page}, timeout=60)
+        resp.raise_for_status()
+        return _json(resp)
+
+    buf = _wb_buffer()
+
+    # Page 1 tells us how many pages there are; the rest are fetched
+    # concurrently (lower max_workers if the API starts rate-limiting).
+    # executor.map yields them in page order as they arrive, so each page is
+    # parsed while later ones are still downloading.
+    total_pages = int(_wb_add_page(buf, indicator, _get_page(1), 1).get("pages") or 1)
+    if total_pages > 1:
+        pages = range(2, total_pages + 1)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total_pages - 1))) as executor:
+            for page, payload in zip(pages, executor.map(_get_page, pages)):
+                _wb_add_page(buf, indicator, payload, page)
+
+    return _wb_frame(buf)
+
+
+# ---- 4. Async variants (optional, needs aiohttp) ----
+
+# For callers already running an event loop (notebooks, async services) that
+# fan out many requests: one loop drives all connections instead of a thread
+# per request. Request building and parsing are shared with the sync fetchers.
+ASYNC_CONNECTION_LIMIT = 20
+
+
+@contextlib.asynccontextmanager
+async def _async_session(session: Optional[aiohttp.ClientSession] = None):
+    if aiohttp is None:
+        raise ImportError("the async fetchers need aiohttp: pip install aiohttp")
+    if session is not None:
+        yield session
+        return
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=ASYNC_CONNECTION_LIMIT),
+        headers={"Accept": "application/json"},
+        timeout=aiohttp.ClientTimeout(total=60),
+    ) as owned:
+        yield owned
+
+
+async def _aget_json(
+    session: aiohttp.ClientSession,
+    limit: asyncio.Semaphore,
+    url: str,
+    params: Dict[str, Any],
+) -> Any:
+    # Same policy as the sync session's Retry: up to HTTP_RETRY_TOTAL retries
+    # on connection errors and 429/5xx, with exponential backoff. The
+    # semaphore caps in-flight requests even on a caller-supplied session;
+    # it is released while backing off.
+    for attempt in range(HTTP_RETRY_TOTAL + 1):
+        last = attempt == HTTP_RETRY_TOTAL
+        async with limit:
+            try:
+                async with session.get(url, params=params) as resp:
+                    if last or resp.status not in HTTP_RETRY_STATUSES:
+                        resp.raise_for_status()
+                        return _loads(await resp.read())
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if last:
+                    raise
+        await asyncio.sleep(HTTP_RETRY_BACKOFF * 2 ** attempt)
+
+
+async def aimf_dm_fetch_indicator(
+    indicator: str,
+    ref_areas: Optional[List[str]] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> pd.DataFrame:
+    url, params = _imf_dm_request(indicator, ref_areas, start_year, end_year)
+    async with _async_session(session) as s:
+        js = await _aget_json(s, asyncio.Semaphore(1), url, params)
+    # Labels come from the (sync, process-cached) ref-area table; load it off
+    # the event loop in case this is the first call.
+    await asyncio.to_thread(_cached_ref_areas)
+    return _imf_dm_parse(js, indicator, start_year, end_year)
+
+
+async def awb_fetch_indicator(
+    indicator: str,
+    iso3_list: Optional[List[str]] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> pd.DataFrame:
+    url, params = _wb_request(indicator, iso3_list, start_year, end_year)
+    limit = asyncio.Semaphore(ASYNC_CONNECTION_LIMIT)
+    buf = _wb_buffer()
+    async with _async_session(session) as s:
+        first = await _aget_json(s, limit, url, {**params, "page": 1})
+        total_pages = int(_wb_add_page(buf, indicator, first, 1).get("pages") or 1)
+        pages = range(2, total_pages + 1)
+        payloads = await asyncio.gather(
+            *(_aget_json(s, limit, url, {**params, "page": page}) for page in pages)
+        )
+    for page, payload in zip(pages, payloads):
+        _wb_add_page(buf, indicator, payload, page)
+    return _wb_frame(buf)
+
+
 __all__ = [
     "RAW_COUNTRIES",
+    "RAW_COUNTRIES_SET",
     "MANUAL_COUNTRY_OVERRIDES",
     "CountryCode",
     "resolve_country",
     "build_country_table",
+    "normalize_area_codes",
+    "ISO2_BY_RAW",
+    "ISO3_BY_RAW",
     "IMF_DM_BASE_URL",
     "imf_dm_get_indicators",
     "imf_dm_ref_areas",
     "imf_dm_fetch_indicator",
+    "imf_dm_fetch_indicators",
+    "imf_dm_fetch_indicator_batched",
+    "chunk_area_codes",
+    "concat_dm_frames",
     "fetch_imf_gdp_growth_weo",
     "fetch_imf_cpi_inflation_weo",
     "WB_BASE_URL",
     "wb_fetch_indicator",
+    "aimf_dm_fetch_indicator",
+    "awb_fetch_indicator",
 ]
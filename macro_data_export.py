@@ -0,0 +1,99 @@
+import zipfile
+from typing import IO, Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+# ---- 1. Excel export ----
+
+# constant_memory streams each row to the file as soon as the next one is
+# started, so sheets must be written strictly row by row (see _write_sheet).
+XLSX_OPTIONS: Dict[str, Any] = {
+    "constant_memory": True,
+    "strings_to_numbers": False,
+    "strings_to_formulas": False,
+    "strings_to_urls": False,
+}
+
+# Same look as the header row pandas' to_excel produces.
+_HEADER_FORMAT = {"bold": True, "border": 1, "align": "center", "valign": "top"}
+
+
+def _prepare_for_xlsx(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast columns to the types xlsxwriter handles fastest: numbers to float64
+    (inf mapped to NaN) and text to Python str, with missing values as None.
+    """
+    converted: Dict[str, pd.Series] = {}
+    for c in df.select_dtypes(include="number").columns:
+        converted[c] = df[c].astype("float64").replace([np.inf, -np.inf], np.nan)
+    for c in df.select_dtypes(include=["object", "string"]).columns:
+        s = df[c]
+        converted[c] = s.astype(str).astype(object).where(s.notna(), None)
+    return df.assign(**converted) if converted else df
+
+
+def _column(ws, series: pd.Series) -> Tuple[Callable[[int, int, Any], Any], List[Any]]:
+    """Return a cell writer for the column's dtype plus its values as Python objects."""
+    if series.dtype == np.float64:
+        def _write_number(row: int, col: int, value: float) -> None:
+            # NaN != NaN: leave missing values blank, like to_excel does.
+            if value == value:
+                ws.write_number(row, col, value)
+        return _write_number, series.tolist()
+    return ws.write, series.to_numpy(dtype=object, na_value=None).tolist()
+
+
+def _write_sheet(workbook, sheet_name: str, df: pd.DataFrame) -> None:
+    ws = workbook.add_worksheet(sheet_name)
+    ws.write_row(0, 0, [str(c) for c in df.columns], workbook.add_format(_HEADER_FORMAT))
+
+    cols = [_column(ws, df[c]) for c in df.columns]
+    writers = [write for write, _ in cols]
+    columns = [values for _, values in cols]
+    for r, row in enumerate(zip(*columns), start=1):
+        for c, (write, value) in enumerate(zip(writers, row)):
+            write(r, c, value)
+
+
+def write_xlsx(output: IO[bytes], sheets: Dict[str, pd.DataFrame]) -> None:
+    """
+    Write each DataFrame to its own sheet (in dict order), without the index.
+
+    Cells are written row by row straight to xlsxwriter instead of going
+    through DataFrame.to_excel, which lets the workbook use constant_memory.
+    """
+    workbook = xlsxwriter.Workbook(output, XLSX_OPTIONS)
+    try:
+        for sheet_name, df in sheets.items():
+            _write_sheet(workbook, sheet_name, _prepare_for_xlsx(df))
+    finally:
+        workbook.close()
+
+
+# ---- 2. CSV export ----
+
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def write_csv_zip(output: IO[bytes], sheets: Dict[str, pd.DataFrame]) -> None:
+    """
+    Write each DataFrame as `<name>.csv` (without the index) into a zip archive.
+
+    Much faster than xlsx for large pulls; compression is kept at level 1
+    since the CSV encoding, not the archive size, is what matters here.
+    Sheets are encoded in-process: worker processes cost more to start and
+    feed (pickling each frame) than they save at the sizes this app pulls.
+    """
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for name, df in sheets.items():
+            zf.writestr(f"{name}.csv", _df_to_csv_bytes(df))
+
+
+__all__ = [
+    "XLSX_OPTIONS",
+    "write_xlsx",
+    "write_csv_zip",
+]
@@ -2,6 +2,10 @@ import requests
 
 BASE = "https://dataservices.imf.org/REST/SDMX_JSON.svc"
 
+# Reused across calls so repeat probes keep the same TLS connection.
+SESSION = requests.Session()
+SESSION.headers.update({"Accept": "application/json"})
+
 def test_imf_ifx_single_country():
     # Example from recent public usage: monthly USD FX rate (IFS) for Netherlands
     url = (
@@ -11,12 +15,13 @@ def test_imf_ifx_single_country():
     print("Testing IMF IFS (NL, monthly USD FX)...")
     print("URL:", url)
 
-    resp = requests.get(url, timeout=10)
+    resp = SESSION.get(url, timeout=10)
 
     print("Status:", resp.status_code)
     print("Content-Type:", resp.headers.get("content-type"))
-    print("First 1000 chars of body:")
-    print(resp.text[:1000])
+    # Decode only the slice being shown, not the whole (possibly multi-MB) body.
+    print("First 1000 bytes of body:")
+    print(resp.content[:1000].decode("utf-8", errors="replace"))
 
 if __name__ == "__main__":
     test_imf_ifx_single_country()